@@ -1,43 +1,40 @@
 import csv
 import logging
+import os
 
 LOGGER = logging.getLogger(__name__)
 
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _report_rows(cost_matrix, group_list, group_by_type):
+    month_costs = list(cost_matrix.values())
+
+    # bu reports are keyed by the configured account groups plus the total row
+    if group_by_type == "bu":
+        group_keys = [*group_list.keys(), "total"]
+    else:
+        group_keys = list(group_list)
+
+    for group in group_keys:
+        yield [group, *(costs.get(group, 0) for costs in month_costs)]
+
 
 def exportreport(export_file, cost_matrix, group_list, group_by_type):
     (export_file.parent).mkdir(parents=True, exist_ok=True)
 
-    with open(export_file, "w", newline="") as ef:
+    # write next to the target and swap it in so a failed run never leaves a
+    # half-written report behind
+    tmp_file = export_file.with_name(f"{export_file.name}.tmp")
+
+    with open(
+        tmp_file, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_SIZE
+    ) as ef:
         writer = csv.writer(ef)
         csv_header = list(cost_matrix.keys())
         csv_header.insert(0, "Month")
 
         writer.writerow(csv_header)
+        writer.writerows(_report_rows(cost_matrix, group_list, group_by_type))
 
-        months = list(cost_matrix.keys())
-
-        if group_by_type == "account":
-            for account in group_list:
-                csv_row: list = []
-                csv_row.append(account)
-                for month in months:
-                    csv_row.append(cost_matrix[month][account])
-                writer.writerow(csv_row)
-        elif group_by_type == "bu":
-            bus = list(group_list.keys())
-            # bus.remove("ss")
-            bus.extend(["total"])
-            for bu in bus:
-                csv_row: list = []
-                csv_row.append(bu)
-                for month in months:
-                    csv_row.append(cost_matrix[month][bu])
-                writer.writerow(csv_row)
-        elif group_by_type == "service":
-            for service in group_list:
-                csv_row: list = []
-                csv_row.append(service)
-                for month in months:
-                    if service in cost_matrix[month]:
-                        csv_row.append(cost_matrix[month][service])
-                writer.writerow(csv_row)
+    os.replace(tmp_file, export_file)
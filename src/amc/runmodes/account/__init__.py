@@ -1,6 +1,8 @@
 import calendar
+import functools
+import heapq
 import logging
-from datetime import date, datetime
+from operator import itemgetter
 
 LOGGER = logging.getLogger(__name__)
 
@@ -8,32 +10,34 @@ LOGGER = logging.getLogger(__name__)
 def _build_costs(cost_and_usage, account_list, daily_average=False):
     account_costs: dict = {}
     account_name_list: list = []
-
-    if daily_average:
-        this_year = (date.today()).year
+    account_names: dict = {
+        org_account["Id"]: org_account["Name"] for org_account in account_list
+    }
+    account_name_get = account_names.get
 
     for period in cost_and_usage["ResultsByTime"]:
         month_costs: dict = {}
-        cost_month = datetime.strptime(period["TimePeriod"]["Start"], "%Y-%m-%d")
-        cost_month_name = cost_month.strftime("%b")
+        cost_year, cost_month = map(int, period["TimePeriod"]["Start"].split("-")[:2])
+        cost_month_name = calendar.month_abbr[cost_month]
 
         if daily_average:
-            day_count = calendar.monthrange(this_year, cost_month.month)[1]
+            day_count = calendar.monthrange(cost_year, cost_month)[1]
 
         for account in period["Groups"]:
-            for org_account in account_list:
-                if account["Keys"][0] == org_account["Id"]:
-                    if daily_average:
-                        month_costs[org_account["Name"]] = (
-                            float(account["Metrics"]["UnblendedCost"]["Amount"])
-                            / day_count
-                        )
-                    else:
-                        month_costs[org_account["Name"]] = account["Metrics"][
-                            "UnblendedCost"
-                        ]["Amount"]
-                    if account not in account_name_list:
-                        account_name_list.append(org_account["Name"])
+            account_name = account_name_get(account["Keys"][0])
+            if account_name is None:
+                continue
+
+            if daily_average:
+                month_costs[account_name] = (
+                    float(account["Metrics"]["UnblendedCost"]["Amount"]) / day_count
+                )
+            else:
+                month_costs[account_name] = account["Metrics"]["UnblendedCost"][
+                    "Amount"
+                ]
+            if account_name not in account_name_list:
+                account_name_list.append(account_name)
 
         account_costs[cost_month_name] = month_costs
 
@@ -48,9 +52,9 @@ def _build_cost_matrix(account_costs, account_name_list):
 
         for account_name in account_name_list:
             if account_name in costs_for_month:
-                account_month_costs[account_name] = float(costs_for_month[account_name])
-        for k in account_month_costs:
-            account_month_costs[k] = round(account_month_costs[k], 2)
+                account_month_costs[account_name] = round(
+                    float(costs_for_month[account_name]), 2
+                )
         account_month_costs["total"] = sum(account_month_costs.values())
 
         cost_matrix[cost_month] = account_month_costs
@@ -58,14 +62,8 @@ def _build_cost_matrix(account_costs, account_name_list):
     return cost_matrix
 
 
-def accountcosts(
-    ce_client,
-    o_client,
-    start_date,
-    end_date,
-    top_cost_count,
-    daily_average=False,
-):
+@functools.cache
+def _list_accounts(o_client):
     account_list: list = []
     list_accounts_response = o_client.list_accounts()
     account_list.extend(list_accounts_response["Accounts"])
@@ -76,7 +74,12 @@ def accountcosts(
         )
         account_list.extend(list_accounts_response["Accounts"])
 
-    account_get_cost_and_usage = ce_client.get_cost_and_usage(
+    return account_list
+
+
+@functools.cache
+def _get_cost_and_usage(ce_client, start_date, end_date):
+    return ce_client.get_cost_and_usage(
         TimePeriod={
             "Start": start_date.strftime("%Y-%m-%d"),
             "End": end_date.strftime("%Y-%m-%d"),
@@ -86,6 +89,19 @@ def accountcosts(
         GroupBy=[{"Type": "DIMENSION", "Key": "LINKED_ACCOUNT"}],
     )
 
+
+def accountcosts(
+    ce_client,
+    o_client,
+    start_date,
+    end_date,
+    top_cost_count,
+    daily_average=False,
+):
+    # monthly and daily run modes request the same data, fetch it only once
+    account_list = _list_accounts(o_client)
+    account_get_cost_and_usage = _get_cost_and_usage(ce_client, start_date, end_date)
+
     LOGGER.debug(account_get_cost_and_usage["ResultsByTime"])
 
     account_costs, account_name_list = _build_costs(
@@ -102,23 +118,23 @@ def accountcosts(
 
     recent_month_costs = account_cost_matrix[recent_month]
 
-    recent_month_costs_sorted = dict(
-        sorted(recent_month_costs.items(), key=lambda item: item[1], reverse=True)
-    )
-
     sorted_account_cost_matrix = {}
 
-    sorted_accounts = list(recent_month_costs_sorted.keys())
-
-    top_sorted_accounts = sorted_accounts[0:top_cost_count]
+    top_sorted_accounts = [
+        account
+        for account, _ in heapq.nlargest(
+            top_cost_count, recent_month_costs.items(), key=itemgetter(1)
+        )
+        if account != "total"
+    ]
 
-    for cost_month in account_cost_matrix.keys():
+    for cost_month, costs_for_month in account_cost_matrix.items():
         top_services_month_total: float = 0
         month_cost: dict = {}
         for service in top_sorted_accounts:
-            if service != "total":
-                month_cost[service] = account_cost_matrix[cost_month][service]
-                top_services_month_total += account_cost_matrix[cost_month][service]
+            service_cost = costs_for_month[service]
+            month_cost[service] = service_cost
+            top_services_month_total += service_cost
         month_cost["total"] = round(top_services_month_total, 2)
 
         sorted_account_cost_matrix[cost_month] = month_cost
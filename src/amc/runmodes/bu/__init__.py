@@ -1,7 +1,6 @@
 import calendar
-import itertools
+import functools
 import logging
-from datetime import date, datetime
 
 LOGGER = logging.getLogger(__name__)
 
@@ -9,16 +8,13 @@ LOGGER = logging.getLogger(__name__)
 def _build_costs(cost_and_usage, daily_average=False):
     account_costs: dict = {}
 
-    if daily_average:
-        this_year = (date.today()).year
-
     for period in cost_and_usage["ResultsByTime"]:
         month_costs: dict = {}
-        cost_month = datetime.strptime(period["TimePeriod"]["Start"], "%Y-%m-%d")
-        cost_month_name = cost_month.strftime("%b")
+        cost_year, cost_month = map(int, period["TimePeriod"]["Start"].split("-")[:2])
+        cost_month_name = calendar.month_abbr[cost_month]
 
         if daily_average:
-            day_count = calendar.monthrange(this_year, cost_month.month)[1]
+            day_count = calendar.monthrange(cost_year, cost_month)[1]
 
         for account in period["Groups"]:
             if daily_average:
@@ -40,12 +36,12 @@ def _build_cost_matrix(account_list, account_costs, ss_percentages=None, ss_cost
     for cost_month, costs_for_month in account_costs.items():
         bu_month_costs: dict = {}
         for bu, bu_accounts in account_list.items():
-            for i, j in itertools.product(bu_accounts, costs_for_month.keys()):
-                if i == j:
+            for account in bu_accounts:
+                if account in costs_for_month:
                     if bu in bu_month_costs:
-                        bu_month_costs[bu] += float(costs_for_month[j])
+                        bu_month_costs[bu] += float(costs_for_month[account])
                     else:
-                        bu_month_costs[bu] = float(costs_for_month[j])
+                        bu_month_costs[bu] = float(costs_for_month[account])
 
             if ss_percentages is None or ss_costs is None:
                 pass
@@ -67,48 +63,43 @@ def _build_cost_matrix(account_list, account_costs, ss_percentages=None, ss_cost
     return cost_matrix
 
 
-def bucosts(
-    ce_client,
-    start_date,
-    end_date,
-    account_list,
-    ss_allocation_percentages,
-    daily_average=False,
-):
-    ss_get_cost_and_usage = ce_client.get_cost_and_usage(
+@functools.cache
+def _get_cost_and_usage(ce_client, start_date, end_date, ss_accounts, exclude_ss):
+    ss_filter = {
+        "Dimensions": {
+            "Key": "LINKED_ACCOUNT",
+            "Values": list(ss_accounts),
+            "MatchOptions": ["EQUALS"],
+        }
+    }
+
+    return ce_client.get_cost_and_usage(
         TimePeriod={
             "Start": start_date.strftime("%Y-%m-%d"),
             "End": end_date.strftime("%Y-%m-%d"),
         },
         Granularity="MONTHLY",
-        Filter={
-            "Dimensions": {
-                "Key": "LINKED_ACCOUNT",
-                "Values": account_list["ss"],
-                "MatchOptions": ["EQUALS"],
-            }
-        },
+        Filter={"Not": ss_filter} if exclude_ss else ss_filter,
         Metrics=["UnblendedCost"],
         GroupBy=[{"Type": "DIMENSION", "Key": "LINKED_ACCOUNT"}],
     )
 
-    account_get_cost_and_usage = ce_client.get_cost_and_usage(
-        TimePeriod={
-            "Start": start_date.strftime("%Y-%m-%d"),
-            "End": end_date.strftime("%Y-%m-%d"),
-        },
-        Granularity="MONTHLY",
-        Filter={
-            "Not": {
-                "Dimensions": {
-                    "Key": "LINKED_ACCOUNT",
-                    "Values": account_list["ss"],
-                    "MatchOptions": ["EQUALS"],
-                }
-            }
-        },
-        Metrics=["UnblendedCost"],
-        GroupBy=[{"Type": "DIMENSION", "Key": "LINKED_ACCOUNT"}],
+
+def bucosts(
+    ce_client,
+    start_date,
+    end_date,
+    account_list,
+    ss_allocation_percentages,
+    daily_average=False,
+):
+    # monthly and daily run modes request the same data, fetch it only once
+    ss_accounts = tuple(account_list["ss"])
+    ss_get_cost_and_usage = _get_cost_and_usage(
+        ce_client, start_date, end_date, ss_accounts, exclude_ss=False
+    )
+    account_get_cost_and_usage = _get_cost_and_usage(
+        ce_client, start_date, end_date, ss_accounts, exclude_ss=True
     )
 
     LOGGER.debug(ss_get_cost_and_usage["ResultsByTime"])
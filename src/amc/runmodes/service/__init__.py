@@ -1,6 +1,8 @@
 import calendar
+import functools
+import heapq
 import logging
-from datetime import date, datetime
+from operator import itemgetter
 
 LOGGER = logging.getLogger(__name__)
 
@@ -9,16 +11,13 @@ def _build_costs(cost_and_usage, daily_average=False):
     service_costs: dict = {}
     service_list: list = []
 
-    if daily_average:
-        this_year = (date.today()).year
-
     for period in cost_and_usage["ResultsByTime"]:
         month_costs: dict = {}
-        cost_month = datetime.strptime(period["TimePeriod"]["Start"], "%Y-%m-%d")
-        cost_month_name = cost_month.strftime("%b")
+        cost_year, cost_month = map(int, period["TimePeriod"]["Start"].split("-")[:2])
+        cost_month_name = calendar.month_abbr[cost_month]
 
         if daily_average:
-            day_count = calendar.monthrange(this_year, cost_month.month)[1]
+            day_count = calendar.monthrange(cost_year, cost_month)[1]
 
         for service in period["Groups"]:
             if daily_average:
@@ -42,35 +41,24 @@ def _build_costs(cost_and_usage, daily_average=False):
 def _build_cost_matrix(service_list, service_costs, service_aggregation):
     cost_matrix: dict = {}
 
+    # first aggregation listing a service wins
+    service_agg_names: dict = {}
+    for agg_name, agg_services in service_aggregation.items():
+        for agg_service in agg_services:
+            service_agg_names.setdefault(agg_service, agg_name)
+
     for cost_month, costs_for_month in service_costs.items():
         service_month_costs: dict = {}
         for service in service_list:
-            for agg_name, agg_services in service_aggregation.items():
-                if service in agg_services:
-                    if service in costs_for_month:
-                        if agg_name in service_month_costs:
-                            service_month_costs[agg_name] += float(
-                                costs_for_month[service]
-                            )
-                        else:
-                            service_month_costs[agg_name] = float(
-                                costs_for_month[service]
-                            )
-
-                    else:
-                        service_month_costs[agg_name] = float(0)
-                    break
-
-                elif service in costs_for_month:
-                    service_month_costs[service] = float(costs_for_month[service])
-
-                else:
-                    service_month_costs[service] = float(0)
-
-        for k in service_aggregation:
-            for v in service_aggregation[k]:
-                if v in service_month_costs:
-                    service_month_costs.pop(v)
+            service_cost = float(costs_for_month.get(service, 0))
+            agg_name = service_agg_names.get(service)
+
+            if agg_name is None:
+                service_month_costs[service] = service_cost
+            elif agg_name in service_month_costs:
+                service_month_costs[agg_name] += service_cost
+            else:
+                service_month_costs[agg_name] = service_cost
 
         for k in service_month_costs:
             service_month_costs[k] = round(service_month_costs[k], 2)
@@ -82,15 +70,9 @@ def _build_cost_matrix(service_list, service_costs, service_aggregation):
     return cost_matrix
 
 
-def servicecosts(
-    ce_client,
-    start_date,
-    end_date,
-    service_aggregation,
-    top_cost_count,
-    daily_average=False,
-):
-    get_cost_and_usage = ce_client.get_cost_and_usage(
+@functools.cache
+def _get_cost_and_usage(ce_client, start_date, end_date):
+    return ce_client.get_cost_and_usage(
         TimePeriod={
             "Start": start_date.strftime("%Y-%m-%d"),
             "End": end_date.strftime("%Y-%m-%d"),
@@ -100,6 +82,18 @@ def servicecosts(
         GroupBy=[{"Type": "DIMENSION", "Key": "SERVICE"}],
     )
 
+
+def servicecosts(
+    ce_client,
+    start_date,
+    end_date,
+    service_aggregation,
+    top_cost_count,
+    daily_average=False,
+):
+    # monthly and daily run modes request the same data, fetch it only once
+    get_cost_and_usage = _get_cost_and_usage(ce_client, start_date, end_date)
+
     LOGGER.debug(get_cost_and_usage["ResultsByTime"])
 
     service_costs, service_list = _build_costs(
@@ -117,23 +111,23 @@ def servicecosts(
 
     recent_month_costs = service_cost_matrix[recent_month]
 
-    recent_month_costs_sorted = dict(
-        sorted(recent_month_costs.items(), key=lambda item: item[1], reverse=True)
-    )
-
     sorted_service_cost_matrix = {}
 
-    sorted_services = list(recent_month_costs_sorted.keys())
-
-    top_sorted_services = sorted_services[0:top_cost_count]
+    top_sorted_services = [
+        service
+        for service, _ in heapq.nlargest(
+            top_cost_count, recent_month_costs.items(), key=itemgetter(1)
+        )
+        if service != "total"
+    ]
 
-    for cost_month in service_cost_matrix.keys():
+    for cost_month, costs_for_month in service_cost_matrix.items():
         top_services_month_total: float = 0
         month_cost: dict = {}
         for service in top_sorted_services:
-            if service != "total":
-                month_cost[service] = service_cost_matrix[cost_month][service]
-                top_services_month_total += service_cost_matrix[cost_month][service]
+            service_cost = costs_for_month[service]
+            month_cost[service] = service_cost
+            top_services_month_total += service_cost
         month_cost["total"] = round(top_services_month_total, 2)
 
         sorted_service_cost_matrix[cost_month] = month_cost